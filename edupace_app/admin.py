@@ -17,22 +17,41 @@ class CourseAdmin(admin.ModelAdmin):
 @admin.register(Teacher)
 class TeacherAdmin(admin.ModelAdmin):
     list_display = ['user', 'employee_id', 'department', 'created_at']
+    list_select_related = ['user']
     search_fields = ['user__username', 'user__first_name', 'user__last_name', 'employee_id']
     filter_horizontal = ['courses']
     readonly_fields = ['created_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user').prefetch_related('courses')
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'courses':
+            kwargs['queryset'] = Course.objects.only('id', 'code', 'name')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
 
 @admin.register(Student)
 class StudentAdmin(admin.ModelAdmin):
     list_display = ['user', 'student_id', 'program', 'enrollment_date', 'created_at']
+    list_select_related = ['user']
     search_fields = ['user__username', 'user__first_name', 'user__last_name', 'student_id']
     filter_horizontal = ['courses']
     readonly_fields = ['created_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user').prefetch_related('courses')
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'courses':
+            kwargs['queryset'] = Course.objects.only('id', 'code', 'name')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
 
 @admin.register(AcademicBoard)
 class AcademicBoardAdmin(admin.ModelAdmin):
     list_display = ['user', 'employee_id', 'designation', 'created_at']
+    list_select_related = ['user']
     search_fields = ['user__username', 'user__first_name', 'user__last_name', 'employee_id']
     readonly_fields = ['created_at']
 
@@ -40,14 +59,24 @@ class AcademicBoardAdmin(admin.ModelAdmin):
 @admin.register(ProgramOutcome)
 class ProgramOutcomeAdmin(admin.ModelAdmin):
     list_display = ['code', 'academic_board', 'created_by', 'created_at']
+    list_select_related = ['academic_board__user', 'created_by']
     list_filter = ['academic_board', 'created_at']
     search_fields = ['code', 'description', 'academic_board__user__username']
     readonly_fields = ['created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('academic_board__user', 'created_by')
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'academic_board':
+            kwargs['queryset'] = AcademicBoard.objects.select_related('user')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 @admin.register(LearningOutcome)
 class LearningOutcomeAdmin(admin.ModelAdmin):
     list_display = ['code', 'course', 'created_by', 'created_at']
+    list_select_related = ['course', 'created_by']
     list_filter = ['course', 'created_at']
     search_fields = ['code', 'description', 'course__code', 'course__name']
     readonly_fields = ['created_at', 'updated_at']
@@ -56,10 +85,19 @@ class LearningOutcomeAdmin(admin.ModelAdmin):
 @admin.register(Grade)
 class GradeAdmin(admin.ModelAdmin):
     list_display = ['student', 'course', 'grade', 'percentage', 'semester', 'academic_year', 'created_at']
+    list_select_related = ['student__user', 'course']
     list_filter = ['grade', 'course', 'semester', 'academic_year', 'created_at']
     search_fields = ['student__student_id', 'student__user__username', 'course__code', 'course__name']
     readonly_fields = ['created_at', 'updated_at']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('student__user', 'course', 'created_by')
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'student':
+            kwargs['queryset'] = Student.objects.select_related('user')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 @admin.register(Assessment)
 class AssessmentAdmin(admin.ModelAdmin):
@@ -107,7 +107,7 @@ class GradeUploadForm(forms.Form):
         teacher = kwargs.pop('teacher', None)
         super().__init__(*args, **kwargs)
         if teacher:
-            self.fields['course'].queryset = teacher.courses.all()
+            self.fields['course'].queryset = teacher.courses.only('id', 'code', 'name')
 
 
 class GradeForm(forms.ModelForm):
@@ -133,13 +133,15 @@ class GradeForm(forms.ModelForm):
         teacher = kwargs.pop('teacher', None)
         super().__init__(*args, **kwargs)
         if teacher:
-            self.fields['course'].queryset = teacher.courses.all()
+            self.fields['course'].queryset = teacher.courses.only('id', 'code', 'name')
 
 
 class AssignTeacherToCourseForm(forms.Form):
     """Form for assigning teachers to courses"""
     teacher = forms.ModelChoiceField(
-        queryset=Teacher.objects.all(),
+        queryset=Teacher.objects.select_related('user').only(
+            'id', 'employee_id', 'user__username', 'user__first_name', 'user__last_name'
+        ),
         widget=forms.Select(attrs={'class': 'form-select'}),
         empty_label='Select a teacher'
     )
@@ -1,78 +1,110 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
+from django.db import transaction
 from edupace_app.models import Student, Teacher, AcademicBoard
 
 
+# Sample accounts, created in this order: (label, user fields, profile model, profile fields).
+# password_hash is make_password(password) computed ahead of time, so creating the
+# accounts doesn't spend a full PBKDF2 run per user; Django upgrades it on first login
+# if the hasher settings change.
+SAMPLE_USERS = [
+    (
+        'Academic Board',
+        {
+            'username': 'board1',
+            'password': 'board123',
+            'password_hash': 'pbkdf2_sha256$1000000$Qow3MwxuPFPE5wkNvvvoBm$Wbeazw2z2ZK6Pbxi0AAyvZGhg/oOARlHk1f7SBfU9Bo=',
+            'first_name': 'Academic',
+            'last_name': 'Board',
+            'email': 'board@edupace.com',
+        },
+        AcademicBoard,
+        {
+            'employee_id': 'AB001',
+            'designation': 'Dean',
+        },
+    ),
+    (
+        'Teacher',
+        {
+            'username': 'teacher1',
+            'password': 'teacher123',
+            'password_hash': 'pbkdf2_sha256$1000000$HaEjJzrLa4q8oU0XCnVgQS$SdXTFMRwMeq131dFs3VzUv7ri+hgv52sB+kkVPhlX04=',
+            'first_name': 'Jane',
+            'last_name': 'Smith',
+            'email': 'teacher@edupace.com',
+        },
+        Teacher,
+        {
+            'employee_id': 'TCH001',
+            'department': 'Computer Science',
+        },
+    ),
+    (
+        'Student',
+        {
+            'username': 'student1',
+            'password': 'student123',
+            'password_hash': 'pbkdf2_sha256$1000000$XMJ4U7Br17mBXnOai7bas0$1r7h/1HZOwUKXmrGwbn2YrCLa1M9adjNoV5cB3brp2w=',
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'email': 'student@edupace.com',
+        },
+        Student,
+        {
+            'student_id': 'STU001',
+            'enrollment_date': '2024-01-01',
+            'program': 'Computer Science',
+        },
+    ),
+]
+
+
 class Command(BaseCommand):
     help = 'Creates sample users for testing (Student, Teacher, and Academic Board)'
 
     def handle(self, *args, **options):
-        # Create Academic Board user
-        if not User.objects.filter(username='board1').exists():
-            board_user = User.objects.create_user(
-                username='board1',
-                password='board123',
-                first_name='Academic',
-                last_name='Board',
-                email='board@edupace.com'
-            )
-            AcademicBoard.objects.create(
-                user=board_user,
-                employee_id='AB001',
-                designation='Dean'
-            )
-            self.stdout.write(
-                self.style.SUCCESS(f'✓ Created Academic Board user: board1 / board123')
-            )
-        else:
-            self.stdout.write(
-                self.style.WARNING('Academic Board user already exists')
-            )
+        usernames = [user_fields['username'] for _, user_fields, _, _ in SAMPLE_USERS]
 
-        # Create Teacher user
-        if not User.objects.filter(username='teacher1').exists():
-            teacher_user = User.objects.create_user(
-                username='teacher1',
-                password='teacher123',
-                first_name='Jane',
-                last_name='Smith',
-                email='teacher@edupace.com'
-            )
-            Teacher.objects.create(
-                user=teacher_user,
-                employee_id='TCH001',
-                department='Computer Science'
-            )
-            self.stdout.write(
-                self.style.SUCCESS(f'✓ Created Teacher user: teacher1 / teacher123')
-            )
-        else:
-            self.stdout.write(
-                self.style.WARNING('Teacher user already exists')
+        # Create all missing users and their profiles in one transaction,
+        # with a single INSERT per table
+        with transaction.atomic():
+            existing = set(
+                User.objects.filter(username__in=usernames).values_list('username', flat=True)
             )
+            missing = [sample for sample in SAMPLE_USERS if sample[1]['username'] not in existing]
 
-        # Create Student user
-        if not User.objects.filter(username='student1').exists():
-            student_user = User.objects.create_user(
-                username='student1',
-                password='student123',
-                first_name='John',
-                last_name='Doe',
-                email='student@edupace.com'
-            )
-            Student.objects.create(
-                user=student_user,
-                student_id='STU001',
-                enrollment_date='2024-01-01',
-                program='Computer Science'
-            )
-            self.stdout.write(
-                self.style.SUCCESS(f'✓ Created Student user: student1 / student123')
-            )
-        else:
-            self.stdout.write(
-                self.style.WARNING('Student user already exists')
+            new_users = []
+            for _, user_fields, _, _ in missing:
+                fields = dict(user_fields)
+                del fields['password']
+                new_users.append(User(password=fields.pop('password_hash'), **fields))
+            User.objects.bulk_create(new_users)
+
+            # Re-read the users so their primary keys are set on every backend
+            users = User.objects.in_bulk(
+                [user.username for user in new_users], field_name='username'
             )
+            profiles = {}
+            for _, user_fields, profile_model, profile_fields in missing:
+                profiles.setdefault(profile_model, []).append(
+                    profile_model(user=users[user_fields['username']], **profile_fields)
+                )
+            for profile_model, objs in profiles.items():
+                profile_model.objects.bulk_create(objs)
+
+        for label, user_fields, _, _ in SAMPLE_USERS:
+            if user_fields['username'] in existing:
+                self.stdout.write(
+                    self.style.WARNING(f'{label} user already exists')
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✓ Created {label} user: {user_fields['username']} / {user_fields['password']}"
+                    )
+                )
 
         self.stdout.write(
             self.style.SUCCESS('\n' + '='*60)
@@ -88,4 +120,3 @@ class Command(BaseCommand):
         self.stdout.write('  Teacher:        username=teacher1, password=teacher123')
         self.stdout.write('  Student:        username=student1, password=student123')
         self.stdout.write('\n')
-
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 00:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('edupace_app', '0002_add_assessment_models'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='grade',
+            index=models.Index(fields=['course', 'academic_year', 'semester'], name='edupace_app_course__682e63_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='grade',
+            index=models.Index(fields=['-academic_year', '-semester', 'course'], name='edupace_app_academi_0a37b9_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('edupace_app', '0003_grade_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='academicboard',
+            options={'base_manager_name': 'objects', 'verbose_name': 'Academic Board Member', 'verbose_name_plural': 'Academic Board Members'},
+        ),
+        migrations.AlterModelOptions(
+            name='student',
+            options={'base_manager_name': 'objects', 'verbose_name': 'Student', 'verbose_name_plural': 'Students'},
+        ),
+        migrations.AlterModelOptions(
+            name='teacher',
+            options={'base_manager_name': 'objects', 'verbose_name': 'Teacher', 'verbose_name_plural': 'Teachers'},
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils.functional import cached_property
 
 
 class Course(models.Model):
@@ -25,6 +26,12 @@ class Course(models.Model):
         return f"{self.code} - {self.name}"
 
 
+class ProfileManager(models.Manager):
+    """Manager for user profile models that always joins the related User"""
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+
 class Teacher(models.Model):
     """Teacher model extending User"""
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='teacher_profile')
@@ -33,12 +40,19 @@ class Teacher(models.Model):
     courses = models.ManyToManyField(Course, related_name='teachers', blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = ProfileManager()
+    
     class Meta:
+        base_manager_name = 'objects'
         verbose_name = "Teacher"
         verbose_name_plural = "Teachers"
     
+    @cached_property
+    def full_name(self):
+        return self.user.get_full_name() or self.user.username
+    
     def __str__(self):
-        return f"{self.user.get_full_name()} ({self.employee_id})"
+        return f"{self.full_name} ({self.employee_id})"
 
 
 class Student(models.Model):
@@ -50,12 +64,19 @@ class Student(models.Model):
     courses = models.ManyToManyField(Course, related_name='students', blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = ProfileManager()
+    
     class Meta:
+        base_manager_name = 'objects'
         verbose_name = "Student"
         verbose_name_plural = "Students"
     
+    @cached_property
+    def full_name(self):
+        return self.user.get_full_name() or self.user.username
+    
     def __str__(self):
-        return f"{self.user.get_full_name()} ({self.student_id})"
+        return f"{self.full_name} ({self.student_id})"
 
 
 class AcademicBoard(models.Model):
@@ -65,12 +86,19 @@ class AcademicBoard(models.Model):
     designation = models.CharField(max_length=100, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = ProfileManager()
+    
     class Meta:
+        base_manager_name = 'objects'
         verbose_name = "Academic Board Member"
         verbose_name_plural = "Academic Board Members"
     
+    @cached_property
+    def full_name(self):
+        return self.user.get_full_name() or self.user.username
+    
     def __str__(self):
-        return f"{self.user.get_full_name()} ({self.employee_id})"
+        return f"{self.full_name} ({self.employee_id})"
 
 
 class ProgramOutcome(models.Model):
@@ -147,6 +175,10 @@ class Grade(models.Model):
     class Meta:
         unique_together = ['student', 'course', 'semester', 'academic_year']
         ordering = ['-academic_year', '-semester', 'course']
+        indexes = [
+            models.Index(fields=['course', 'academic_year', 'semester']),
+            models.Index(fields=['-academic_year', '-semester', 'course']),
+        ]
         verbose_name = "Grade"
         verbose_name_plural = "Grades"
     
@@ -1,10 +1,53 @@
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.http import Http404
 from django.shortcuts import redirect
 from django.contrib import messages
 from functools import wraps
+from operator import itemgetter
+import re
 from django.db.models import Q, Sum, Avg
 from django.db import connection, transaction
-from .models import Teacher, Student, AcademicBoard, AssessmentGrade, AssessmentToLO, LOToPO
+from django.contrib.auth.models import User
+from .models import Course, Teacher, Student, AcademicBoard, Grade, AssessmentGrade, AssessmentToLO, LOToPO
+
+
+# Letter grades accepted by grade uploads
+VALID_GRADES = frozenset(choice[0] for choice in Grade.GRADE_CHOICES)
+
+# Grade sheet header patterns, tried in order against each lower-cased column name
+GRADE_SHEET_COLUMNS = (
+    ('student_id', re.compile(r'student.*id|id.*student')),
+    ('grade', re.compile(r'grade')),
+    ('percentage', re.compile(r'percent')),
+)
+
+
+# (role, related name of the profile on User), in lookup order
+ROLE_PROFILES = (
+    ('teacher', 'teacher_profile'),
+    ('student', 'student_profile'),
+    ('academic_board', 'academic_board_profile'),
+)
+
+
+def _get_role_and_profile(user):
+    """Resolve the user's (role, profile) once and cache it on the user instance"""
+    cached = getattr(user, '_edupace_role', None)
+    if cached is None:
+        # Join all profile tables in one query instead of probing them one by one
+        related_names = [related_name for _, related_name in ROLE_PROFILES]
+        joined_user = User.objects.select_related(*related_names).get(pk=user.pk)
+        cached = (None, None)
+        for role, related_name in ROLE_PROFILES:
+            try:
+                profile = getattr(joined_user, related_name)
+            except ObjectDoesNotExist:
+                continue
+            profile.user = user
+            cached = (role, profile)
+            break
+        user._edupace_role = cached
+    return cached
 
 
 def get_user_role(user):
@@ -12,25 +55,15 @@ def get_user_role(user):
     if not user.is_authenticated:
         return None
     
-    if hasattr(user, 'teacher_profile'):
-        return 'teacher'
-    elif hasattr(user, 'student_profile'):
-        return 'student'
-    elif hasattr(user, 'academic_board_profile'):
-        return 'academic_board'
-    return None
+    return _get_role_and_profile(user)[0]
 
 
 def get_user_profile(user):
     """Get the profile object for a user based on their role"""
-    role = get_user_role(user)
-    if role == 'teacher':
-        return user.teacher_profile
-    elif role == 'student':
-        return user.student_profile
-    elif role == 'academic_board':
-        return user.academic_board_profile
-    return None
+    if not user.is_authenticated:
+        return None
+    
+    return _get_role_and_profile(user)[1]
 
 
 def role_required(*allowed_roles):
@@ -59,19 +92,23 @@ def check_course_edit_permission(user, course):
     return True
 
 
+def check_course_edit_permission_by_id(user, course_id):
+    """
+    Same check as check_course_edit_permission, for callers that only have the course id.
+    Only asks the database whether the course exists instead of loading the whole row.
+    """
+    if get_user_role(user) != 'academic_board':
+        return False
+    return Course.objects.filter(pk=course_id).exists()
+
+
 def check_learning_outcome_permission(user, course):
     """Check if user can add learning outcomes (Teacher only)"""
     if get_user_role(user) != 'teacher':
         return False
     
-    try:
-        teacher = user.teacher_profile
-        if course not in teacher.courses.all():
-            return False
-    except Teacher.DoesNotExist:
-        return False
-    
-    return True
+    teacher = get_user_profile(user)
+    return teacher.courses.filter(pk=course.pk).exists()
 
 
 def check_grade_permission(user, course):
@@ -79,21 +116,33 @@ def check_grade_permission(user, course):
     return check_learning_outcome_permission(user, course)
 
 
+def get_permitted_object(queryset, permission_filter, **lookup):
+    """
+    Fetch an object through a permission filter (e.g. {'course__teachers': teacher}) in one query.
+    Returns None if the object exists but the filter excludes it; raises Http404 if it doesn't exist.
+    """
+    obj = queryset.filter(**lookup, **permission_filter).first()
+    if obj is None and not queryset.model._default_manager.filter(**lookup).exists():
+        raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+    return obj
+
+
 def excel_to_pdf(excel_file_path, output_pdf_path):
     """
     Convert Excel file to PDF
-    Requires: openpyxl, reportlab, pandas
+    Requires: openpyxl, reportlab
     """
     try:
-        import pandas as pd
+        from openpyxl import load_workbook
         from reportlab.lib import colors
         from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+        from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
         from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
         from reportlab.lib.units import inch
         
-        # Read Excel file
-        df = pd.read_excel(excel_file_path)
+        # Read Excel file (first sheet, header row included)
+        workbook = load_workbook(excel_file_path, read_only=True, data_only=True)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
         
         # Create PDF
         doc = SimpleDocTemplate(output_pdf_path, pagesize=A4)
@@ -114,11 +163,12 @@ def excel_to_pdf(excel_file_path, output_pdf_path):
         elements.append(title)
         elements.append(Spacer(1, 0.2*inch))
         
-        # Convert DataFrame to list of lists for table
-        data = [df.columns.tolist()] + df.values.tolist()
+        # Convert rows to list of lists for table; empty cells render blank
+        data = [['' if value is None else value for value in row] for row in rows]
+        workbook.close()
         
-        # Create table
-        table = Table(data)
+        # Create table; LongTable lays out page by page and repeats the header row
+        table = LongTable(data, repeatRows=1)
         
         # Style the table
         table.setStyle(TableStyle([
@@ -156,76 +206,120 @@ def process_excel_grades(excel_file, course, semester='', academic_year='', crea
     """
     try:
         import pandas as pd
+        from openpyxl import load_workbook
         from .models import Student, Grade
         
-        # Read Excel file
-        df = pd.read_excel(excel_file)
-        
-        # Expected columns (case-insensitive)
-        df.columns = df.columns.str.strip().str.lower()
-        
-        # Map common column names
-        student_id_col = None
-        grade_col = None
-        percentage_col = None
-        
-        for col in df.columns:
-            if 'student' in col and 'id' in col:
-                student_id_col = col
-            elif 'grade' in col:
-                grade_col = col
-            elif 'percentage' in col or 'percent' in col:
-                percentage_col = col
-        
-        if not student_id_col or not grade_col:
-            return False, "Excel file must contain 'Student ID' and 'Grade' columns"
+        # Stream the sheet in read-only mode rather than materialising it with read_excel
+        workbook = load_workbook(excel_file, read_only=True, data_only=True)
+        try:
+            sheet = workbook.active
+            
+            # Expected columns (case-insensitive)
+            header_row = next(sheet.iter_rows(max_row=1, values_only=True), ())
+            headers = [str(header).strip().lower() if header is not None else '' for header in header_row]
+            
+            # Map common column names
+            mapping = {}
+            for col in headers:
+                for key, pattern in GRADE_SHEET_COLUMNS:
+                    if key not in mapping and pattern.search(col):
+                        mapping[key] = col
+                        break
+            student_id_col = mapping.get('student_id')
+            grade_col = mapping.get('grade')
+            percentage_col = mapping.get('percentage')
+            
+            if not student_id_col or not grade_col:
+                return False, "Excel file must contain 'Student ID' and 'Grade' columns", []
+            
+            # Keep only the needed columns, indexed by sheet row number; blank rows are skipped.
+            # Column positions are resolved once and rows are padded up to the last one, so
+            # each row is picked apart with a single itemgetter call.
+            columns = [col for col in (student_id_col, grade_col, percentage_col) if col]
+            positions = [headers.index(col) for col in columns]
+            pick = itemgetter(*positions)
+            records = {}
+            for row_number, row in enumerate(
+                sheet.iter_rows(min_row=2, max_col=max(positions) + 1, values_only=True), start=2
+            ):
+                values = pick(row)
+                if any(value is not None for value in values):
+                    records[row_number] = values
+        finally:
+            workbook.close()
+        
+        df = pd.DataFrame.from_dict(records, orient='index', columns=columns)
+        
+        # Normalise the columns once, vectorised, instead of cell by cell
+        row_numbers = df.index.to_numpy()
+        student_ids = df[student_id_col].astype(str).str.strip()
+        grade_values = df[grade_col].astype(str).str.strip().str.upper()
+        if percentage_col:
+            percentages = pd.to_numeric(df[percentage_col], errors='coerce')
+            bad_percentage = df[percentage_col].notna() & percentages.isna()
+        else:
+            percentages = pd.Series(float('nan'), index=df.index)
+            bad_percentage = pd.Series(False, index=df.index)
         
-        grades_created = 0
-        errors = []
+        # Fetch every referenced student in one query instead of one per row;
+        # the user join added by ProfileManager isn't needed here
+        students = Student.objects.select_related(None).only('id', 'student_id').in_bulk(
+            student_ids.unique().tolist(), field_name='student_id'
+        )
         
-        for index, row in df.iterrows():
-            try:
-                student_id = str(row[student_id_col]).strip()
-                grade_value = str(row[grade_col]).strip().upper()
-                percentage = None
-                
-                if percentage_col and pd.notna(row.get(percentage_col)):
-                    percentage = float(row[percentage_col])
-                
-                # Get student
-                try:
-                    student = Student.objects.get(student_id=student_id)
-                except Student.DoesNotExist:
-                    errors.append(f"Student with ID {student_id} not found (row {index + 2})")
-                    continue
-                
-                # Validate grade
-                valid_grades = [choice[0] for choice in Grade.GRADE_CHOICES]
-                if grade_value not in valid_grades:
-                    errors.append(f"Invalid grade '{grade_value}' for student {student_id} (row {index + 2})")
-                    continue
-                
-                # Create or update grade
-                grade, created = Grade.objects.update_or_create(
-                    student=student,
-                    course=course,
-                    semester=semester,
-                    academic_year=academic_year,
-                    defaults={
-                        'grade': grade_value,
-                        'percentage': percentage,
-                        'created_by': created_by,
-                    }
+        not_found = ~student_ids.isin(list(students))
+        invalid_percentage = ~not_found & bad_percentage
+        invalid_grade = ~not_found & ~bad_percentage & ~grade_values.isin(VALID_GRADES)
+        good = ~(not_found | invalid_percentage | invalid_grade)
+        
+        row_errors = [
+            (row, f"Student with ID {student_id} not found (row {row})")
+            for row, student_id in zip(row_numbers[not_found], student_ids[not_found])
+        ]
+        if percentage_col:
+            row_errors += [
+                (row, f"Invalid percentage '{value}' for student {student_id} (row {row})")
+                for row, student_id, value in zip(
+                    row_numbers[invalid_percentage], student_ids[invalid_percentage],
+                    df[percentage_col][invalid_percentage]
                 )
-                
-                if created:
-                    grades_created += 1
-                    
-            except Exception as e:
-                errors.append(f"Error processing row {index + 2}: {str(e)}")
-                continue
+            ]
+        row_errors += [
+            (row, f"Invalid grade '{grade_value}' for student {student_id} (row {row})")
+            for row, student_id, grade_value in zip(
+                row_numbers[invalid_grade], student_ids[invalid_grade], grade_values[invalid_grade]
+            )
+        ]
+        errors = [error for row, error in sorted(row_errors, key=lambda item: item[0])]
+        
+        # Keyed by student so a repeated row overwrites the earlier one, as before
+        grades_by_student = {}
+        for student_id, grade_value, percentage in zip(
+            student_ids[good].to_numpy(), grade_values[good].to_numpy(), percentages[good].to_numpy()
+        ):
+            student = students[student_id]
+            grades_by_student[student.pk] = Grade(
+                student=student,
+                course=course,
+                semester=semester,
+                academic_year=academic_year,
+                grade=grade_value,
+                percentage=None if pd.isna(percentage) else float(percentage),
+                created_by=created_by,
+            )
+        
+        # Create or update all grades in a single upsert
+        grades = list(grades_by_student.values())
+        with transaction.atomic():
+            Grade.objects.bulk_create(
+                grades,
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=['student', 'course', 'semester', 'academic_year'],
+                update_fields=['grade', 'percentage', 'created_by', 'updated_at'],
+            )
         
-        message = f"Successfully created/updated {grades_created} grade(s)."
+        message = f"Successfully created/updated {len(grades)} grade(s)."
         if errors:
             message += f" {len(errors)} error(s) occurred."
         
@@ -6,7 +6,9 @@ from django.views.generic import ListView, DetailView, CreateView, UpdateView, D
 from django.urls import reverse_lazy
 from django.http import HttpResponse, JsonResponse, FileResponse
 from django.core.exceptions import PermissionDenied
-from django.db.models import Q
+from django.core.paginator import Paginator
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.safestring import mark_safe
 from django import forms
 import os
@@ -27,11 +29,15 @@ from .forms import (
 from .utils import (
     get_user_role, get_user_profile, role_required,
     check_course_edit_permission, check_learning_outcome_permission,
-    check_grade_permission, excel_to_pdf, process_excel_grades,
+    check_grade_permission, get_permitted_object, excel_to_pdf, process_excel_grades,
     get_course_graph_data, calculate_lo_score, calculate_po_score
 )
 
 
+# Rows per page for the course and grade tables
+PAGE_SIZE = 50
+
+
 def login_view(request):
     """Login view with role selection"""
     if request.user.is_authenticated:
@@ -89,8 +95,16 @@ def dashboard_redirect(request):
 def student_dashboard(request):
     """Student dashboard - view grades, program outcomes, learning outcomes"""
     student = get_user_profile(request.user)
-    courses = student.courses.all()
-    grades = Grade.objects.filter(student=student).select_related('course')
+    # Only the columns the dashboard table shows
+    courses = list(student.courses.only('id', 'code', 'name', 'credits'))
+    grades = list(Grade.objects.filter(student=student).only('id', 'course', 'grade'))
+    
+    # Attach each course's grades so the template doesn't rescan every grade per course
+    grades_by_course = {}
+    for grade in grades:
+        grades_by_course.setdefault(grade.course_id, []).append(grade)
+    for course in courses:
+        course.student_grades = grades_by_course.get(course.id, [])
     
     context = {
         'student': student,
@@ -108,11 +122,14 @@ def student_course_detail(request, course_id):
     course = get_object_or_404(Course, id=course_id)
     
     # Check if student is enrolled
-    if course not in student.courses.all():
+    if not student.courses.filter(pk=course.pk).exists():
         messages.error(request, 'You are not enrolled in this course.')
         return redirect('edupace_app:student_dashboard')
     
-    grade = Grade.objects.filter(student=student, course=course).first()
+    # Latest term's grade; only the columns the page shows
+    grade = Grade.objects.filter(student=student, course=course).only(
+        'grade', 'percentage', 'semester', 'academic_year'
+    ).first()
     
     # Get graph data with student scores
     graph_data = get_course_graph_data(course, student=student)
@@ -164,17 +181,21 @@ def student_course_detail(request, course_id):
 def teacher_dashboard(request):
     """Teacher dashboard"""
     teacher = get_user_profile(request.user)
-    courses = teacher.courses.all()
+    # Only the columns the dashboard table shows
+    courses = teacher.courses.only('id', 'code', 'name', 'credits')
     
-    # Get statistics
-    total_courses = courses.count()
-    courses_with_los = courses.filter(learning_outcomes__isnull=False).distinct().count()
+    # Get statistics in a single query; an EXISTS per course avoids joining
+    # (and de-duplicating) every learning outcome row
+    stats = teacher.courses.aggregate(
+        total=Count('id'),
+        with_los=Count('id', filter=Q(Exists(LearningOutcome.objects.filter(course=OuterRef('pk'))))),
+    )
     
     context = {
         'teacher': teacher,
         'courses': courses,
-        'total_courses': total_courses,
-        'courses_with_los': courses_with_los,
+        'total_courses': stats['total'],
+        'courses_with_los': stats['with_los'],
     }
     return render(request, 'edupace_app/teacher/dashboard.html', context)
 
@@ -187,14 +208,17 @@ def teacher_course_detail(request, course_id):
     course = get_object_or_404(Course, id=course_id)
     
     # Check if teacher teaches this course
-    if course not in teacher.courses.all():
+    if not teacher.courses.filter(pk=course.pk).exists():
         messages.error(request, 'You do not teach this course.')
         return redirect('edupace_app:teacher_dashboard')
     
     learning_outcomes = course.learning_outcomes.all()
     assessments = course.assessments.all()
     assessment_to_lo = AssessmentToLO.objects.filter(assessment__course=course).select_related('assessment', 'learning_outcome')
-    grades = Grade.objects.filter(course=course).select_related('student')
+    grades = Grade.objects.filter(course=course).select_related('student__user').order_by(
+        '-academic_year', '-semester', 'student__student_id'
+    )
+    grades_page = Paginator(grades, PAGE_SIZE).get_page(request.GET.get('page'))
     
     # Get graph data
     graph_data = get_course_graph_data(course)
@@ -205,7 +229,8 @@ def teacher_course_detail(request, course_id):
         'learning_outcomes': learning_outcomes,
         'assessments': assessments,
         'assessment_to_lo': assessment_to_lo,
-        'grades': grades,
+        'grades': grades_page.object_list,
+        'page_obj': grades_page,
         'graph_data': graph_data_json,
     }
     return render(request, 'edupace_app/teacher/course_detail.html', context)
@@ -223,17 +248,14 @@ def add_learning_outcome(request, course_id):
         messages.error(request, 'You cannot add learning outcomes to this course.')
         return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
-    if request.method == 'POST':
-        form = LearningOutcomeForm(request.POST)
-        if form.is_valid():
-            learning_outcome = form.save(commit=False)
-            learning_outcome.course = course
-            learning_outcome.created_by = request.user
-            learning_outcome.save()
-            messages.success(request, f'Learning outcome {learning_outcome.code} added successfully.')
-            return redirect('edupace_app:teacher_course_detail', course_id=course_id)
-    else:
-        form = LearningOutcomeForm()
+    form = LearningOutcomeForm(request.POST or None)
+    if request.method == 'POST' and form.is_valid():
+        learning_outcome = form.save(commit=False)
+        learning_outcome.course = course
+        learning_outcome.created_by = request.user
+        learning_outcome.save()
+        messages.success(request, f'Learning outcome {learning_outcome.code} added successfully.')
+        return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -246,22 +268,22 @@ def add_learning_outcome(request, course_id):
 @role_required('teacher')
 def edit_learning_outcome(request, lo_id):
     """Edit a learning outcome"""
-    learning_outcome = get_object_or_404(LearningOutcome, id=lo_id)
     teacher = get_user_profile(request.user)
+    # Fetch the outcome only through a course this teacher teaches
+    learning_outcome = get_permitted_object(
+        LearningOutcome.objects.select_related('course'), {'course__teachers': teacher}, id=lo_id
+    )
     
     # Check permissions
-    if learning_outcome.course not in teacher.courses.all():
+    if learning_outcome is None:
         messages.error(request, 'You do not have permission to edit this learning outcome.')
         return redirect('edupace_app:teacher_dashboard')
     
-    if request.method == 'POST':
-        form = LearningOutcomeForm(request.POST, instance=learning_outcome)
-        if form.is_valid():
-            form.save()
-            messages.success(request, 'Learning outcome updated successfully.')
-            return redirect('edupace_app:teacher_course_detail', course_id=learning_outcome.course.id)
-    else:
-        form = LearningOutcomeForm(instance=learning_outcome)
+    form = LearningOutcomeForm(request.POST or None, instance=learning_outcome)
+    if request.method == 'POST' and form.is_valid():
+        form.save()
+        messages.success(request, 'Learning outcome updated successfully.')
+        return redirect('edupace_app:teacher_course_detail', course_id=learning_outcome.course.id)
     
     context = {
         'form': form,
@@ -275,15 +297,19 @@ def edit_learning_outcome(request, lo_id):
 @role_required('teacher')
 def delete_learning_outcome(request, lo_id):
     """Delete a learning outcome"""
-    learning_outcome = get_object_or_404(LearningOutcome, id=lo_id)
     teacher = get_user_profile(request.user)
-    course = learning_outcome.course
+    # Fetch the outcome only through a course this teacher teaches
+    learning_outcome = get_permitted_object(
+        LearningOutcome.objects.select_related('course'), {'course__teachers': teacher}, id=lo_id
+    )
     
     # Check permissions
-    if course not in teacher.courses.all():
+    if learning_outcome is None:
         messages.error(request, 'You do not have permission to delete this learning outcome.')
         return redirect('edupace_app:teacher_dashboard')
     
+    course = learning_outcome.course
+    
     if request.method == 'POST':
         learning_outcome.delete()
         messages.success(request, 'Learning outcome deleted successfully.')
@@ -358,29 +384,26 @@ def upload_grades(request, course_id):
         messages.error(request, 'You cannot upload grades for this course.')
         return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
-    if request.method == 'POST':
-        form = GradeUploadForm(request.POST, request.FILES, teacher=teacher)
-        if form.is_valid():
-            excel_file = form.cleaned_data['excel_file']
-            semester = form.cleaned_data.get('semester', '')
-            academic_year = form.cleaned_data.get('academic_year', '')
-            
-            # Process Excel file
-            success, message, errors = process_excel_grades(
-                excel_file, course, semester, academic_year, request.user
-            )
-            
-            if success:
-                messages.success(request, message)
-                if errors:
-                    for error in errors[:10]:  # Show first 10 errors
-                        messages.warning(request, error)
-            else:
-                messages.error(request, message)
-            
-            return redirect('edupace_app:teacher_course_detail', course_id=course_id)
-    else:
-        form = GradeUploadForm(teacher=teacher, initial={'course': course})
+    form = GradeUploadForm(request.POST or None, request.FILES or None, teacher=teacher, initial={'course': course})
+    if request.method == 'POST' and form.is_valid():
+        excel_file = form.cleaned_data['excel_file']
+        semester = form.cleaned_data.get('semester', '')
+        academic_year = form.cleaned_data.get('academic_year', '')
+        
+        # Process Excel file
+        success, message, errors = process_excel_grades(
+            excel_file, course, semester, academic_year, request.user
+        )
+        
+        if success:
+            messages.success(request, message)
+            if errors:
+                # One combined warning listing the first 10 errors
+                messages.warning(request, 'Import warnings:\n' + '\n'.join(errors[:10]))
+        else:
+            messages.error(request, message)
+        
+        return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -396,56 +419,59 @@ def convert_grades_to_pdf(request, course_id):
     teacher = get_user_profile(request.user)
     course = get_object_or_404(Course, id=course_id)
     
-    if course not in teacher.courses.all():
+    if not teacher.courses.filter(pk=course.pk).exists():
         messages.error(request, 'You do not teach this course.')
         return redirect('edupace_app:teacher_dashboard')
     
-    grades = Grade.objects.filter(course=course).select_related('student')
+    # Fetch once; the emptiness check and the export both use the list
+    grades = list(Grade.objects.filter(course=course).select_related('student__user'))
     
-    if not grades.exists():
+    if not grades:
         messages.error(request, 'No grades found for this course.')
         return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
     # Create temporary Excel file
     try:
-        import pandas as pd
+        from openpyxl import Workbook
         
-        data = []
+        # Stream rows straight into a write-only workbook, kept in a spooled buffer
+        # (in memory unless it grows large) that excel_to_pdf reads directly
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(['Student ID', 'Student Name', 'Grade', 'Percentage', 'Semester', 'Academic Year'])
         for grade in grades:
-            data.append({
-                'Student ID': grade.student.student_id,
-                'Student Name': grade.student.user.get_full_name() or grade.student.user.username,
-                'Grade': grade.grade,
-                'Percentage': grade.percentage or '',
-                'Semester': grade.semester or '',
-                'Academic Year': grade.academic_year or '',
-            })
-        
-        df = pd.DataFrame(data)
+            sheet.append([
+                grade.student.student_id,
+                grade.student.user.get_full_name() or grade.student.user.username,
+                grade.grade,
+                grade.percentage or '',
+                grade.semester or '',
+                grade.academic_year or '',
+            ])
         
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_excel:
-            df.to_excel(tmp_excel.name, index=False)
-            excel_path = tmp_excel.name
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_pdf:
-            pdf_path = tmp_pdf.name
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024, suffix='.xlsx') as excel_file:
+            workbook.save(excel_file)
+            excel_file.seek(0)
+            
+            # Convert to PDF
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_pdf:
+                pdf_path = tmp_pdf.name
+            converted = excel_to_pdf(excel_file, pdf_path)
         
-        # Convert to PDF
-        if excel_to_pdf(excel_path, pdf_path):
+        if converted:
             response = FileResponse(
                 open(pdf_path, 'rb'),
+                as_attachment=True,
                 content_type='application/pdf',
                 filename=f'{course.code}_grades.pdf'
             )
-            # Clean up
-            os.unlink(excel_path)
+            # Remove the PDF once the response has been streamed (or the client went away);
+            # runs after FileResponse has closed the file
+            response._resource_closers.append(lambda: os.unlink(pdf_path))
             return response
         else:
             messages.error(request, 'Error converting grades to PDF.')
-            os.unlink(excel_path)
-            if os.path.exists(pdf_path):
-                os.unlink(pdf_path)
+            os.unlink(pdf_path)
             return redirect('edupace_app:teacher_course_detail', course_id=course_id)
             
     except Exception as e:
@@ -459,12 +485,26 @@ def convert_grades_to_pdf(request, course_id):
 @role_required('academic_board')
 def academic_board_dashboard(request):
     """Academic Board dashboard"""
-    courses = Course.objects.all()
-    total_courses = courses.count()
+    # One page of courses at a time. The per-course counts are correlated subqueries
+    # rather than joins, so the paginator's total COUNT stays a plain count of courses
+    # and the page keeps the model ordering.
+    teacher_counts = Teacher.courses.through.objects.filter(course=OuterRef('pk')).values(
+        'course'
+    ).annotate(count=Count('*')).values('count')
+    student_counts = Student.courses.through.objects.filter(course=OuterRef('pk')).values(
+        'course'
+    ).annotate(count=Count('*')).values('count')
+    courses = Course.objects.only('id', 'code', 'name', 'credits').annotate(
+        teacher_count=Coalesce(Subquery(teacher_counts), 0),
+        student_count=Coalesce(Subquery(student_counts), 0),
+    )
+    paginator = Paginator(courses, PAGE_SIZE)
+    page_obj = paginator.get_page(request.GET.get('page'))
     
     context = {
-        'courses': courses,
-        'total_courses': total_courses,
+        'courses': page_obj.object_list,
+        'page_obj': page_obj,
+        'total_courses': paginator.count,
     }
     return render(request, 'edupace_app/academic_board/dashboard.html', context)
 
@@ -473,14 +513,11 @@ def academic_board_dashboard(request):
 @role_required('academic_board')
 def create_course(request):
     """Create a new course"""
-    if request.method == 'POST':
-        form = CourseForm(request.POST)
-        if form.is_valid():
-            course = form.save()
-            messages.success(request, f'Course {course.code} created successfully.')
-            return redirect('edupace_app:academic_board_course_detail', course_id=course.id)
-    else:
-        form = CourseForm()
+    form = CourseForm(request.POST or None)
+    if request.method == 'POST' and form.is_valid():
+        course = form.save()
+        messages.success(request, f'Course {course.code} created successfully.')
+        return redirect('edupace_app:academic_board_course_detail', course_id=course.id)
     
     return render(request, 'edupace_app/academic_board/create_course.html', {'form': form})
 
@@ -489,7 +526,11 @@ def create_course(request):
 @role_required('academic_board')
 def academic_board_course_detail(request, course_id):
     """Academic Board view of a specific course"""
-    course = get_object_or_404(Course, id=course_id)
+    # Profile querysets join their user by default, so the prefetches carry it too
+    course = get_object_or_404(
+        Course.objects.prefetch_related('learning_outcomes', 'teachers', 'students'),
+        id=course_id
+    )
     academic_board = get_user_profile(request.user)
     
     # Get POs for this academic board
@@ -498,7 +539,10 @@ def academic_board_course_detail(request, course_id):
     lo_to_po = LOToPO.objects.filter(learning_outcome__course=course).select_related('learning_outcome', 'program_outcome')
     teachers = course.teachers.all()
     students = course.students.all()
-    grades = Grade.objects.filter(course=course).select_related('student')
+    grades = Grade.objects.filter(course=course).select_related('student__user').order_by(
+        '-academic_year', '-semester', 'student__student_id'
+    )
+    grades_page = Paginator(grades, PAGE_SIZE).get_page(request.GET.get('page'))
     
     # Get graph data
     graph_data = get_course_graph_data(course)
@@ -511,7 +555,8 @@ def academic_board_course_detail(request, course_id):
         'lo_to_po': lo_to_po,
         'teachers': teachers,
         'students': students,
-        'grades': grades,
+        'grades': grades_page.object_list,
+        'page_obj': grades_page,
         'graph_data': graph_data_json,
     }
     return render(request, 'edupace_app/academic_board/course_detail.html', context)
@@ -528,14 +573,11 @@ def edit_course(request, course_id):
         messages.error(request, 'This course is locked and cannot be edited.')
         return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
     
-    if request.method == 'POST':
-        form = CourseForm(request.POST, instance=course)
-        if form.is_valid():
-            form.save()
-            messages.success(request, 'Course updated successfully.')
-            return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
-    else:
-        form = CourseForm(instance=course)
+    form = CourseForm(request.POST or None, instance=course)
+    if request.method == 'POST' and form.is_valid():
+        form.save()
+        messages.success(request, 'Course updated successfully.')
+        return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -569,21 +611,17 @@ def add_program_outcome(request):
     """Add program outcome (Academic Board level, not course-specific)"""
     academic_board = get_user_profile(request.user)
     
-    if request.method == 'POST':
-        form = ProgramOutcomeForm(request.POST)
-        if form.is_valid():
-            try:
-                program_outcome = form.save(commit=False)
-                program_outcome.academic_board = academic_board
-                program_outcome.created_by = request.user
-                program_outcome.save()
-                messages.success(request, f'Program outcome {program_outcome.code} added successfully.')
-                return redirect('edupace_app:academic_board_dashboard')
-            except Exception as e:
-                messages.error(request, f'Error saving program outcome: {str(e)}')
-        # If form is invalid, fall through to render form with errors
-    else:
-        form = ProgramOutcomeForm()
+    form = ProgramOutcomeForm(request.POST or None)
+    if request.method == 'POST' and form.is_valid():
+        try:
+            program_outcome = form.save(commit=False)
+            program_outcome.academic_board = academic_board
+            program_outcome.created_by = request.user
+            program_outcome.save()
+            messages.success(request, f'Program outcome {program_outcome.code} added successfully.')
+            return redirect('edupace_app:academic_board_dashboard')
+        except Exception as e:
+            messages.error(request, f'Error saving program outcome: {str(e)}')
     
     context = {
         'form': form,
@@ -595,22 +633,21 @@ def add_program_outcome(request):
 @role_required('academic_board')
 def edit_program_outcome(request, po_id):
     """Edit a program outcome"""
-    program_outcome = get_object_or_404(ProgramOutcome, id=po_id)
     academic_board = get_user_profile(request.user)
+    program_outcome = get_permitted_object(
+        ProgramOutcome.objects.all(), {'academic_board': academic_board}, id=po_id
+    )
     
     # Check if PO belongs to this academic board
-    if program_outcome.academic_board != academic_board:
+    if program_outcome is None:
         messages.error(request, 'You do not have permission to edit this program outcome.')
         return redirect('edupace_app:academic_board_dashboard')
     
-    if request.method == 'POST':
-        form = ProgramOutcomeForm(request.POST, instance=program_outcome)
-        if form.is_valid():
-            form.save()
-            messages.success(request, 'Program outcome updated successfully.')
-            return redirect('edupace_app:academic_board_dashboard')
-    else:
-        form = ProgramOutcomeForm(instance=program_outcome)
+    form = ProgramOutcomeForm(request.POST or None, instance=program_outcome)
+    if request.method == 'POST' and form.is_valid():
+        form.save()
+        messages.success(request, 'Program outcome updated successfully.')
+        return redirect('edupace_app:academic_board_dashboard')
     
     context = {
         'form': form,
@@ -623,11 +660,13 @@ def edit_program_outcome(request, po_id):
 @role_required('academic_board')
 def delete_program_outcome(request, po_id):
     """Delete a program outcome"""
-    program_outcome = get_object_or_404(ProgramOutcome, id=po_id)
     academic_board = get_user_profile(request.user)
+    program_outcome = get_permitted_object(
+        ProgramOutcome.objects.all(), {'academic_board': academic_board}, id=po_id
+    )
     
     # Check if PO belongs to this academic board
-    if program_outcome.academic_board != academic_board:
+    if program_outcome is None:
         messages.error(request, 'You do not have permission to delete this program outcome.')
         return redirect('edupace_app:academic_board_dashboard')
     
@@ -652,15 +691,12 @@ def assign_teacher_to_course(request, course_id):
         messages.error(request, 'This course is locked. You cannot assign teachers.')
         return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
     
-    if request.method == 'POST':
-        form = AssignTeacherToCourseForm(request.POST)
-        if form.is_valid():
-            teacher = form.cleaned_data['teacher']
-            course.teachers.add(teacher)
-            messages.success(request, f'Teacher {teacher.user.get_full_name()} assigned to course.')
-            return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
-    else:
-        form = AssignTeacherToCourseForm()
+    form = AssignTeacherToCourseForm(request.POST or None)
+    if request.method == 'POST' and form.is_valid():
+        teacher = form.cleaned_data['teacher']
+        course.teachers.add(teacher)
+        messages.success(request, f'Teacher {teacher.user.get_full_name()} assigned to course.')
+        return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -683,23 +719,18 @@ def enroll_student_to_course(request, course_id):
     enrolled_student_ids = course.students.values_list('id', flat=True)
     available_students = Student.objects.exclude(id__in=enrolled_student_ids)
     
-    if request.method == 'POST':
-        form = EnrollStudentToCourseForm(request.POST)
-        # Set queryset to only available students
-        form.fields['student'].queryset = available_students
-        if form.is_valid():
-            student = form.cleaned_data['student']
-            # Double-check student is not already enrolled
-            if student in course.students.all():
-                messages.warning(request, f'Student {student.user.get_full_name()} is already enrolled in this course.')
-            else:
-                course.students.add(student)
-                messages.success(request, f'Student {student.user.get_full_name()} enrolled in course.')
-            return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
-    else:
-        form = EnrollStudentToCourseForm()
-        # Filter out students already enrolled in this course
-        form.fields['student'].queryset = available_students
+    form = EnrollStudentToCourseForm(request.POST or None)
+    # Only offer (and accept) students not already enrolled in this course
+    form.fields['student'].queryset = available_students
+    if request.method == 'POST' and form.is_valid():
+        student = form.cleaned_data['student']
+        # Double-check student is not already enrolled
+        if course.students.filter(pk=student.pk).exists():
+            messages.warning(request, f'Student {student.user.get_full_name()} is already enrolled in this course.')
+        else:
+            course.students.add(student)
+            messages.success(request, f'Student {student.user.get_full_name()} enrolled in course.')
+        return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -717,20 +748,17 @@ def add_assessment(request, course_id):
     teacher = get_user_profile(request.user)
     course = get_object_or_404(Course, id=course_id)
     
-    if course not in teacher.courses.all():
+    if not teacher.courses.filter(pk=course.pk).exists():
         messages.error(request, 'You do not teach this course.')
         return redirect('edupace_app:teacher_dashboard')
     
-    if request.method == 'POST':
-        form = AssessmentForm(request.POST)
-        if form.is_valid():
-            assessment = form.save(commit=False)
-            assessment.course = course
-            assessment.save()
-            messages.success(request, f'Assessment {assessment.name} added successfully.')
-            return redirect('edupace_app:teacher_course_detail', course_id=course_id)
-    else:
-        form = AssessmentForm()
+    form = AssessmentForm(request.POST or None)
+    if request.method == 'POST' and form.is_valid():
+        assessment = form.save(commit=False)
+        assessment.course = course
+        assessment.save()
+        messages.success(request, f'Assessment {assessment.name} added successfully.')
+        return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -743,21 +771,21 @@ def add_assessment(request, course_id):
 @role_required('teacher')
 def edit_assessment(request, assessment_id):
     """Edit an assessment"""
-    assessment = get_object_or_404(Assessment, id=assessment_id)
     teacher = get_user_profile(request.user)
+    # Fetch the assessment only through a course this teacher teaches
+    assessment = get_permitted_object(
+        Assessment.objects.select_related('course'), {'course__teachers': teacher}, id=assessment_id
+    )
     
-    if assessment.course not in teacher.courses.all():
+    if assessment is None:
         messages.error(request, 'You do not have permission to edit this assessment.')
         return redirect('edupace_app:teacher_dashboard')
     
-    if request.method == 'POST':
-        form = AssessmentForm(request.POST, instance=assessment)
-        if form.is_valid():
-            form.save()
-            messages.success(request, 'Assessment updated successfully.')
-            return redirect('edupace_app:teacher_course_detail', course_id=assessment.course.id)
-    else:
-        form = AssessmentForm(instance=assessment)
+    form = AssessmentForm(request.POST or None, instance=assessment)
+    if request.method == 'POST' and form.is_valid():
+        form.save()
+        messages.success(request, 'Assessment updated successfully.')
+        return redirect('edupace_app:teacher_course_detail', course_id=assessment.course.id)
     
     context = {
         'form': form,
@@ -771,14 +799,18 @@ def edit_assessment(request, assessment_id):
 @role_required('teacher')
 def delete_assessment(request, assessment_id):
     """Delete an assessment"""
-    assessment = get_object_or_404(Assessment, id=assessment_id)
     teacher = get_user_profile(request.user)
-    course = assessment.course
+    # Fetch the assessment only through a course this teacher teaches
+    assessment = get_permitted_object(
+        Assessment.objects.select_related('course'), {'course__teachers': teacher}, id=assessment_id
+    )
     
-    if course not in teacher.courses.all():
+    if assessment is None:
         messages.error(request, 'You do not have permission to delete this assessment.')
         return redirect('edupace_app:teacher_dashboard')
     
+    course = assessment.course
+    
     if request.method == 'POST':
         assessment.delete()
         messages.success(request, 'Assessment deleted successfully.')
@@ -798,25 +830,22 @@ def add_assessment_grade(request, course_id):
     teacher = get_user_profile(request.user)
     course = get_object_or_404(Course, id=course_id)
     
-    if course not in teacher.courses.all():
+    if not teacher.courses.filter(pk=course.pk).exists():
         messages.error(request, 'You do not teach this course.')
         return redirect('edupace_app:teacher_dashboard')
     
-    if request.method == 'POST':
-        form = AssessmentGradeForm(request.POST, course=course)
-        if form.is_valid():
-            grade, created = AssessmentGrade.objects.update_or_create(
-                assessment=form.cleaned_data['assessment'],
-                student=form.cleaned_data['student'],
-                defaults={'grade': form.cleaned_data['grade']}
-            )
-            if created:
-                messages.success(request, 'Assessment grade added successfully.')
-            else:
-                messages.success(request, 'Assessment grade updated successfully.')
-            return redirect('edupace_app:teacher_course_detail', course_id=course_id)
-    else:
-        form = AssessmentGradeForm(course=course)
+    form = AssessmentGradeForm(request.POST or None, course=course)
+    if request.method == 'POST' and form.is_valid():
+        grade, created = AssessmentGrade.objects.update_or_create(
+            assessment=form.cleaned_data['assessment'],
+            student=form.cleaned_data['student'],
+            defaults={'grade': form.cleaned_data['grade']}
+        )
+        if created:
+            messages.success(request, 'Assessment grade added successfully.')
+        else:
+            messages.success(request, 'Assessment grade updated successfully.')
+        return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -832,25 +861,22 @@ def connect_assessment_to_lo(request, course_id):
     teacher = get_user_profile(request.user)
     course = get_object_or_404(Course, id=course_id)
     
-    if course not in teacher.courses.all():
+    if not teacher.courses.filter(pk=course.pk).exists():
         messages.error(request, 'You do not teach this course.')
         return redirect('edupace_app:teacher_dashboard')
     
-    if request.method == 'POST':
-        form = AssessmentToLOForm(request.POST, course=course)
-        if form.is_valid():
-            connection, created = AssessmentToLO.objects.update_or_create(
-                assessment=form.cleaned_data['assessment'],
-                learning_outcome=form.cleaned_data['learning_outcome'],
-                defaults={'weight': form.cleaned_data['weight']}
-            )
-            if created:
-                messages.success(request, 'Connection created successfully.')
-            else:
-                messages.success(request, 'Connection updated successfully.')
-            return redirect('edupace_app:teacher_course_detail', course_id=course_id)
-    else:
-        form = AssessmentToLOForm(course=course)
+    form = AssessmentToLOForm(request.POST or None, course=course)
+    if request.method == 'POST' and form.is_valid():
+        connection, created = AssessmentToLO.objects.update_or_create(
+            assessment=form.cleaned_data['assessment'],
+            learning_outcome=form.cleaned_data['learning_outcome'],
+            defaults={'weight': form.cleaned_data['weight']}
+        )
+        if created:
+            messages.success(request, 'Connection created successfully.')
+        else:
+            messages.success(request, 'Connection updated successfully.')
+        return redirect('edupace_app:teacher_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -863,14 +889,20 @@ def connect_assessment_to_lo(request, course_id):
 @role_required('teacher')
 def delete_assessment_to_lo(request, connection_id):
     """Delete assessment to LO connection"""
-    connection = get_object_or_404(AssessmentToLO, id=connection_id)
     teacher = get_user_profile(request.user)
-    course = connection.assessment.course
-    
-    if course not in teacher.courses.all():
+    # Fetch the connection only through a course this teacher teaches
+    connection = get_permitted_object(
+        AssessmentToLO.objects.select_related('assessment__course', 'learning_outcome'),
+        {'assessment__course__teachers': teacher},
+        id=connection_id,
+    )
+    
+    if connection is None:
         messages.error(request, 'You do not have permission to delete this connection.')
         return redirect('edupace_app:teacher_dashboard')
     
+    course = connection.assessment.course
+    
     if request.method == 'POST':
         connection.delete()
         messages.success(request, 'Connection deleted successfully.')
@@ -892,21 +924,18 @@ def connect_lo_to_po(request, course_id):
     course = get_object_or_404(Course, id=course_id)
     academic_board = get_user_profile(request.user)
     
-    if request.method == 'POST':
-        form = LOToPOForm(request.POST, course=course, academic_board=academic_board)
-        if form.is_valid():
-            connection, created = LOToPO.objects.update_or_create(
-                learning_outcome=form.cleaned_data['learning_outcome'],
-                program_outcome=form.cleaned_data['program_outcome'],
-                defaults={'weight': form.cleaned_data['weight']}
-            )
-            if created:
-                messages.success(request, 'Connection created successfully.')
-            else:
-                messages.success(request, 'Connection updated successfully.')
-            return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
-    else:
-        form = LOToPOForm(course=course, academic_board=academic_board)
+    form = LOToPOForm(request.POST or None, course=course, academic_board=academic_board)
+    if request.method == 'POST' and form.is_valid():
+        connection, created = LOToPO.objects.update_or_create(
+            learning_outcome=form.cleaned_data['learning_outcome'],
+            program_outcome=form.cleaned_data['program_outcome'],
+            defaults={'weight': form.cleaned_data['weight']}
+        )
+        if created:
+            messages.success(request, 'Connection created successfully.')
+        else:
+            messages.success(request, 'Connection updated successfully.')
+        return redirect('edupace_app:academic_board_course_detail', course_id=course_id)
     
     context = {
         'form': form,
@@ -919,7 +948,9 @@ def connect_lo_to_po(request, course_id):
 @role_required('academic_board')
 def delete_lo_to_po(request, connection_id):
     """Delete LO to PO connection"""
-    connection = get_object_or_404(LOToPO, id=connection_id)
+    connection = get_object_or_404(
+        LOToPO.objects.select_related('learning_outcome__course', 'program_outcome'), id=connection_id
+    )
     course = connection.learning_outcome.course
     
     if request.method == 'POST':
@@ -945,7 +976,7 @@ def get_course_graph_api(request, course_id):
     # If student, get their profile
     if get_user_role(request.user) == 'student':
         student = get_user_profile(request.user)
-        if course not in student.courses.all():
+        if not student.courses.filter(pk=course.pk).exists():
             return JsonResponse({'error': 'Not enrolled in this course'}, status=403)
     
     graph_data = get_course_graph_data(course, student=student)